@@ -0,0 +1,105 @@
+import numpy as np
+import pygame as pg
+
+
+def _make_games(module):
+    states = (
+        ([(40, 20), (20, 20), (0, 20)], (100, 60)),
+        ([(320, 240)], (0, 0)),
+        ([(600, 460), (600, 440)], (20, 400)),
+    )
+    games = []
+    for positions, apple_position in states:
+        snake, apple = module.Snake(), module.Apple()
+        snake.positions = positions
+        apple.position = apple_position
+        games.append((snake, apple))
+    return games
+
+
+def test_grid_observation_cells(_the_snake, snake, apple):
+    snake.positions = [(40, 20), (20, 20), (0, 20)]
+    apple.position = (100, 60)
+    grid = _the_snake.grid_observation(snake, apple)
+    assert grid.shape == (_the_snake.GRID_HEIGHT, _the_snake.GRID_WIDTH)
+    assert grid[1, 2] == _the_snake.CELL_HEAD
+    assert grid[1, 1] == grid[1, 0] == _the_snake.CELL_SNAKE
+    assert grid[3, 5] == _the_snake.CELL_APPLE
+    assert np.count_nonzero(grid) == 4
+
+
+def test_grid_observation_reuses_out(_the_snake, snake, apple):
+    out = np.full((_the_snake.GRID_HEIGHT, _the_snake.GRID_WIDTH), 7,
+                  dtype=np.uint8)
+    apple.position = (0, 0)
+    assert _the_snake.grid_observation(snake, apple, out=out) is out
+    assert (out == _the_snake.grid_observation(snake, apple)).all()
+
+
+def test_batch_grid_observations_rows_match_games(_the_snake):
+    games = _make_games(_the_snake)
+    batch = _the_snake.batch_grid_observations(games)
+    assert batch.shape == (3, _the_snake.GRID_HEIGHT, _the_snake.GRID_WIDTH)
+    assert batch.flags['C_CONTIGUOUS']
+    for row, (snake, apple) in zip(batch, games):
+        assert (row == _the_snake.grid_observation(snake, apple)).all()
+
+
+def test_batch_grid_observations_reuses_out(_the_snake):
+    games = _make_games(_the_snake)
+    out = np.full((3, _the_snake.GRID_HEIGHT, _the_snake.GRID_WIDTH), 7,
+                  dtype=np.uint8)
+    assert _the_snake.batch_grid_observations(games, out=out) is out
+    assert (out == _the_snake.batch_grid_observations(games)).all()
+
+
+def test_pixel_observation_downsamples_screen(_the_snake, apple):
+    _the_snake.screen.fill(_the_snake.BOARD_BACKGROUND_COLOR)
+    apple.position = (100, 60)
+    apple.draw()
+    image = _the_snake.pixel_observation()
+    assert image.shape == (_the_snake.GRID_HEIGHT, _the_snake.GRID_WIDTH, 3)
+    assert tuple(image[3, 5]) == _the_snake.APPLE_COLOR
+    assert not image[0, 0].any()
+
+
+def test_batch_pixel_observations_per_surface(_the_snake):
+    size = (_the_snake.SCREEN_WIDTH, _the_snake.SCREEN_HEIGHT)
+    cell = (_the_snake.GRID_SIZE, _the_snake.GRID_SIZE)
+    surfaces = [pg.Surface(size, 0, 32) for _ in range(2)]
+    pg.draw.rect(surfaces[0], _the_snake.APPLE_COLOR, pg.Rect((100, 60), cell))
+    pg.draw.rect(surfaces[1], _the_snake.SNAKE_COLOR, pg.Rect((0, 0), cell))
+    out = np.full((2, _the_snake.GRID_HEIGHT, _the_snake.GRID_WIDTH, 3), 7,
+                  dtype=np.uint8)
+    batch = _the_snake.batch_pixel_observations(surfaces, out=out)
+    assert batch is out
+    assert tuple(batch[0, 3, 5]) == _the_snake.APPLE_COLOR
+    assert not batch[0, 0, 0].any()
+    assert tuple(batch[1, 0, 0]) == _the_snake.SNAKE_COLOR
+    assert not batch[1, 3, 5].any()
+    single = np.empty_like(out[0])
+    assert _the_snake.pixel_observation(surfaces[1], out=single) is single
+
+
+def test_frame_stack_keeps_latest_frames(_the_snake):
+    stack = _the_snake.FrameStack(2, 3, (2,))
+    stack.reset(0, np.array([1, 1]))
+    stack.reset(1, np.array([5, 5]))
+    frames = stack.push(np.array([[2, 2], [6, 6]]))
+    assert frames.tolist() == [
+        [[1, 1], [1, 1], [2, 2]],
+        [[5, 5], [5, 5], [6, 6]],
+    ]
+    out = np.empty_like(frames)
+    assert stack.push(np.array([[3, 3], [7, 7]]), out=out) is out
+    assert out[0].tolist() == [[1, 1], [2, 2], [3, 3]]
+
+
+def test_frame_stack_reset_keeps_other_envs(_the_snake):
+    stack = _the_snake.FrameStack(3, 2, (2,))
+    stack.push(np.array([[1, 1], [2, 2], [3, 3]]))
+    before = stack.frames.copy()
+    stack.reset(1, np.array([9, 9]))
+    assert stack.frames[1].tolist() == [[9, 9], [9, 9]]
+    assert (stack.frames[0] == before[0]).all()
+    assert (stack.frames[2] == before[2]).all()
@@ -1,5 +1,6 @@
 from random import choice
 
+import numpy as np
 import pygame as pg
 
 # Константы для размеров поля и сетки:
@@ -30,6 +31,12 @@ SNAKE_COLOR = (0, 255, 0)
 # Скорость движения змейки:
 SPEED = 20
 
+# Значения ячеек в наблюдении-сетке для агентов:
+CELL_EMPTY = 0
+CELL_SNAKE = 1
+CELL_HEAD = 2
+CELL_APPLE = 3
+
 # Настройка игрового окна:
 screen = pg.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
 
@@ -283,6 +290,134 @@ def partial_redraw(snake, apple, old_tail, old_apple_position):
     pg.display.update()
 
 
+# Наблюдения игрового поля для агентов.
+def grid_observation(snake, apple, out=None):
+    """
+    Растеризует игровое поле в массив (GRID_HEIGHT, GRID_WIDTH), где
+    каждой ячейке сетки соответствует одно значение CELL_*.
+    Экран не читается: данные берутся напрямую из snake.positions
+    и apple.position.
+    Параметры:
+        snake: экземпляр класса Snake.
+        apple: экземпляр класса Apple.
+        out: необязательный массив uint8 нужной формы, в который
+        записывается результат (например, срез общего буфера).
+    """
+    if out is None:
+        out = np.empty((GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+    out.fill(CELL_EMPTY)
+
+    cells = np.asarray(snake.positions) // GRID_SIZE
+    out[cells[:, 1], cells[:, 0]] = CELL_SNAKE
+    head_x, head_y = snake.get_head_position()
+    out[head_y // GRID_SIZE, head_x // GRID_SIZE] = CELL_HEAD
+    apple_x, apple_y = apple.position
+    out[apple_y // GRID_SIZE, apple_x // GRID_SIZE] = CELL_APPLE
+    return out
+
+
+def batch_grid_observations(games, out=None):
+    """
+    Собирает наблюдения нескольких игр в один непрерывный буфер
+    формы (len(games), GRID_HEIGHT, GRID_WIDTH).
+    Параметры:
+        games: последовательность пар (snake, apple).
+        out: необязательный заранее выделенный буфер, который
+        переиспользуется между тиками.
+    """
+    if out is None:
+        out = np.empty((len(games), GRID_HEIGHT, GRID_WIDTH), dtype=np.uint8)
+    for index, (snake, apple) in enumerate(games):
+        grid_observation(snake, apple, out=out[index])
+    return out
+
+
+def pixel_observation(surface=None, out=None):
+    """
+    Возвращает уменьшенное RGB-изображение поверхности формы
+    (GRID_HEIGHT, GRID_WIDTH, 3): по одному пикселю из центра каждой
+    ячейки. Читается представление pg.surfarray.pixels3d без копирования
+    всей поверхности, копируются только выбранные пиксели.
+    Параметры:
+        surface: 24- или 32-битная поверхность игры; по умолчанию screen.
+        out: необязательный массив uint8 нужной формы для результата
+        (например, срез общего буфера).
+    """
+    if surface is None:
+        surface = screen
+    if out is None:
+        out = np.empty((GRID_HEIGHT, GRID_WIDTH, 3), dtype=np.uint8)
+    offset = GRID_SIZE // 2
+    pixels = pg.surfarray.pixels3d(surface)
+    # surfarray индексируется как (x, y), поэтому транспонируем в (y, x)
+    np.copyto(out, pixels[offset::GRID_SIZE, offset::GRID_SIZE]
+              .transpose(1, 0, 2))
+    # Освобождаем блокировку поверхности до следующей отрисовки
+    del pixels
+    return out
+
+
+def batch_pixel_observations(surfaces, out=None):
+    """
+    Собирает уменьшенные изображения нескольких поверхностей в один
+    непрерывный буфер формы (len(surfaces), GRID_HEIGHT, GRID_WIDTH, 3).
+    Параметры:
+        surfaces: последовательность поверхностей, по одной на игру.
+        out: необязательный заранее выделенный буфер, который
+        переиспользуется между тиками.
+    """
+    if out is None:
+        out = np.empty((len(surfaces), GRID_HEIGHT, GRID_WIDTH, 3),
+                       dtype=np.uint8)
+    for index, surface in enumerate(surfaces):
+        pixel_observation(surface, out=out[index])
+    return out
+
+
+class FrameStack:
+    """
+    Хранит последние кадры наблюдений нескольких игр в одном
+    непрерывном буфере.
+    Атрибуты:
+        frames (np.ndarray): буфер формы (n_envs, n_frames, *frame_shape);
+        история каждой игры непрерывна и идёт от самого старого кадра
+        к самому новому.
+    """
+
+    def __init__(self, n_envs, n_frames, frame_shape, dtype=np.uint8):
+        self.frames = np.zeros((n_envs, n_frames, *frame_shape), dtype=dtype)
+
+    def _result(self, out):
+        """Копирует стек в out, если он передан, иначе отдает буфер."""
+        if out is None:
+            return self.frames
+        np.copyto(out, self.frames)
+        return out
+
+    def push(self, batch, out=None):
+        """
+        Сдвигает историю всех игр и записывает новые кадры последними.
+        Параметры:
+            batch: кадры формы (n_envs, *frame_shape), например
+            результат batch_grid_observations.
+            out: необязательный массив формы frames для копии стека.
+        Без out возвращается сам буфер frames: он перезаписывается
+        при следующем push или reset, поэтому сохранять его нужно копией.
+        """
+        self.frames[:, :-1] = self.frames[:, 1:]
+        self.frames[:, -1] = batch
+        return self._result(out)
+
+    def reset(self, index, frame, out=None):
+        """
+        Заполняет историю одной игры кадром frame (начало её эпизода),
+        не затрагивая остальные игры. Параметр out и возвращаемое
+        значение - как в push.
+        """
+        self.frames[index] = frame
+        return self._result(out)
+
+
 def main():
     """Основная функция игры"""
     # Инициализация игры